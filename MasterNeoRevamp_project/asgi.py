@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MasterNeoRevamp_project.settings')
 
 application = get_asgi_application()
+
+# Imported once the apps are loaded
+from api.utils import warm_url_resolver  # noqa: E402
+
+warm_url_resolver()
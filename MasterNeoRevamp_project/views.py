@@ -1,10 +1,30 @@
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 from rest_framework.generics import GenericAPIView
 from rest_framework.decorators import api_view, authentication_classes
-from rest_framework.response import Response
-from rest_framework.reverse import reverse
+from api.utils import links_etag, render_links
 from .serializers import IndexCustomSerializer
 
 
+INDEX_MESSAGE = "Hello, World!, this is the index page."
+INDEX_ROUTES = {"api": "api-root", "discord_login": "discord-login"}
+
+
+def _index_etag(request, *args, **kwargs):
+    return links_etag(request, INDEX_ROUTES, message=INDEX_MESSAGE)
+
+
+@method_decorator(
+    [
+        cache_control(public=True, max_age=300),
+        vary_on_headers("Host"),
+        condition(etag_func=_index_etag),
+    ],
+    name="dispatch",
+)
 class Index(GenericAPIView):
     """
     API endpoint for the index page.
@@ -12,15 +32,8 @@ class Index(GenericAPIView):
 
     serializer_class = IndexCustomSerializer
 
-    def get(self, request, format=None):
-        serializer = IndexCustomSerializer(
-            data={
-                "message": "Hello, World!, this is the index page.",
-                "api": reverse("api-root", request=request, format=format),
-                "discord_login": reverse(
-                    "discord-login", request=request, format=format
-                ),
-            }
+    def get(self, request):
+        return HttpResponse(
+            render_links(request, INDEX_ROUTES, message=INDEX_MESSAGE),
+            content_type="application/json",
         )
-        serializer.is_valid()
-        return Response(serializer.data)
@@ -1,6 +1,13 @@
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 
 
+# All token authentication classes share the same bearer security definition
+BEARER_SECURITY_DEFINITION = {
+    "type": "http",
+    "scheme": "bearer",
+}
+
+
 class DiscordAuthenticationScheme(OpenApiAuthenticationExtension):
     """
     Represents a Discord authentication scheme for OpenAPI.
@@ -12,10 +19,7 @@ class DiscordAuthenticationScheme(OpenApiAuthenticationExtension):
     name = "discordAuth"
 
     def get_security_definition(self, auto_schema):
-        return {
-            "type": "http",
-            "scheme": "bearer",
-        }
+        return BEARER_SECURITY_DEFINITION
 
 
 class TwitterAuthenticationScheme(OpenApiAuthenticationExtension):
@@ -25,10 +29,7 @@ class TwitterAuthenticationScheme(OpenApiAuthenticationExtension):
     name = "twitterAuth"
 
     def get_security_definition(self, auto_schema):
-        return {
-            "type": "http",
-            "scheme": "bearer",
-        }
+        return BEARER_SECURITY_DEFINITION
 
 
 class DiscordOrTwitterAuthenticationScheme(OpenApiAuthenticationExtension):
@@ -36,7 +37,4 @@ class DiscordOrTwitterAuthenticationScheme(OpenApiAuthenticationExtension):
     name = "discordOrTwitterAuth"
 
     def get_security_definition(self, auto_schema):
-        return {
-            "type": "http",
-            "scheme": "bearer",
-        }
+        return BEARER_SECURITY_DEFINITION
@@ -3,6 +3,39 @@ from talents.models import Talent
 from jobs.models import Company
 
 
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
+
+class ReadOnly(permissions.BasePermission):
+    """
+    Permission class that only allows safe (read-only) requests.
+
+    Combine it with another permission to allow reads to everyone and writes
+    to some users only, e.g. ``ReadOnly | IsTalent``.
+    """
+
+    def has_permission(self, request, view):
+        return request.method in SAFE_METHODS
+
+
+class IsTalent(permissions.BasePermission):
+    """
+    Permission class that only allows requests made by a talent.
+    """
+
+    def has_permission(self, request, view):
+        return isinstance(request.user, Talent)
+
+
+class IsCompany(permissions.BasePermission):
+    """
+    Permission class that only allows requests made by a company.
+    """
+
+    def has_permission(self, request, view):
+        return isinstance(request.user, Company)
+
+
 class IsTalentOrReadOnly(permissions.BasePermission):
     """
     Custom permission class that allows read-only access to any request,
@@ -21,13 +54,52 @@ class IsTalentOrReadOnly(permissions.BasePermission):
         Returns:
             bool: True if the user has permission, False otherwise.
         """
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in SAFE_METHODS:
+            return True
+
+        user = request.user
+        if not user.is_authenticated:
+            return False
+        if getattr(user, "is_superuser", False):
+            return True
+        if not isinstance(user, Talent):
+            return False
+
+        # Compare foreign key ids so the related talent is never loaded.
+        return obj.talent_id == user.pk
+
+
+class IsSelfOrReadOnly(permissions.BasePermission):
+    """
+    Custom permission class that allows read-only access to any request,
+    but only allows write access to the talent themselves.
+    """
+
+    def has_object_permission(self, request, view, obj):
+        """
+        Check if the user has permission to access the object.
+
+        Args:
+            request (HttpRequest): The request being made.
+            view (View): The view handling the request.
+            obj (Talent): The talent being accessed.
+
+        Returns:
+            bool: True if the user has permission, False otherwise.
+        """
+        if request.method in SAFE_METHODS:
             return True
 
-        if not isinstance(request.user, Talent):
+        user = request.user
+        if not user.is_authenticated:
+            return False
+        if getattr(user, "is_superuser", False):
+            return True
+        if not isinstance(user, Talent):
             return False
 
-        return obj.talent == request.user
+        return obj.pk == user.pk
+
 
 class IsCompanyOrReadOnly(permissions.BasePermission):
     """
@@ -46,10 +118,16 @@ class IsCompanyOrReadOnly(permissions.BasePermission):
         Returns:
             bool: True if the user has permission, False otherwise.
         """
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in SAFE_METHODS:
+            return True
+
+        user = request.user
+        if not user.is_authenticated:
+            return False
+        if getattr(user, "is_superuser", False):
             return True
-        if not isinstance(request.user, Company):
+        if not isinstance(user, Company):
             return False
-        
+
         # Write permissions are only allowed to the company of the job.
-        return obj.company == request.user
\ No newline at end of file
+        return obj.company_id == user.pk
\ No newline at end of file
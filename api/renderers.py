@@ -0,0 +1,34 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    orjson encodes in C and writes bytes directly, which makes a noticeable
+    difference on list pages. The output matches DRF's compact JSON: dates,
+    times and values orjson does not know natively (decimals, lazy
+    translation strings, querysets, ...) are handed to DRF's JSON encoder,
+    non-string keys are coerced to strings, and U+2028/U+2029 are escaped.
+    The one difference is that NaN and infinities render as null, where
+    DRF's strict JSON raises an error. Indented responses, as requested by
+    the browsable API, fall back to the default renderer.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data, default=self.encoder_class().default, option=self.options
+        )
+        # Like DRF, keep the output a strict subset of JavaScript
+        ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+        return ret.replace(b"\xe2\x80\xa9", b"\\u2029")
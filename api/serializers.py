@@ -1,4 +1,7 @@
+import copy
+
 import requests
+from django.db import models
 from rest_framework import serializers
 from timezone_field.rest_framework import TimeZoneSerializerField
 
@@ -7,6 +10,49 @@ from oauth2.utils import upload_image
 from talents.models import Talent, Review, Experience, Skill
 
 
+class CachedFieldsMixin:
+    """
+    Mixin that caches the fields built by ``get_fields`` per serializer class.
+
+    ``ModelSerializer.get_fields`` introspects the model on every instantiation.
+    With this mixin the introspection only runs for the first instance of each
+    class; later instances receive shallow, unbound copies of the cached fields.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        if "_cached_fields" not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return {name: _copy_field(field) for name, field in cls._cached_fields.items()}
+
+
+def _copy_field(field):
+    """
+    Return a shallow copy of an unbound field, safe to bind to a serializer.
+
+    Binding sets attributes on the field and on its child field, if any, so
+    the child is copied too. Nested serializers are deep-copied, as DRF does.
+
+    Args:
+        field (Field): The field to copy.
+
+    Returns:
+        Field: The copy.
+    """
+    if isinstance(field, serializers.BaseSerializer):
+        return copy.deepcopy(field)
+    clone = copy.copy(field)
+    for attr in ("child", "child_relation"):
+        child = getattr(field, attr, None)
+        if isinstance(child, serializers.Field):
+            child_clone = _copy_field(child)
+            # List and many-related fields bind their child on construction
+            if child.parent is field:
+                child_clone.parent = clone
+            setattr(clone, attr, child_clone)
+    return clone
+
+
 class CustomSerializer(serializers.Serializer):
     """
     Serializer for custom data.
@@ -21,12 +67,14 @@ class CustomSerializer(serializers.Serializer):
     experiences = serializers.CharField(max_length=200)
 
 
-class JobOutSerializer(serializers.ModelSerializer):
+class JobOutSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Job model used for outputting job data.
     """
 
-    job_types = serializers.StringRelatedField(many=True)
+    job_types = serializers.SlugRelatedField(
+        slug_field="name", many=True, read_only=True
+    )
 
     class Meta:
         model = Job
@@ -40,9 +88,11 @@ class JobOutSerializer(serializers.ModelSerializer):
             "job_description",
             "job_types",
         ]
+        # Output only: no validators or write-side field arguments are built
+        read_only_fields = fields
 
 
-class JobInSerializer(serializers.ModelSerializer):
+class JobInSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating a new Job instance.
 
@@ -69,6 +119,24 @@ class JobInSerializer(serializers.ModelSerializer):
         ]
 
 
+class NameListSerializer(serializers.ListSerializer):
+    """
+    List serializer for models rendered as their name only.
+
+    The items are built directly from the names instead of running the child
+    serializer for each instance; querysets only fetch the name column.
+    """
+
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        if isinstance(data, models.QuerySet):
+            names = data.values_list("name", flat=True)
+        else:
+            names = (instance.name for instance in data)
+        return [{"name": name} for name in names]
+
+
 class JobTypeSerializer(serializers.ModelSerializer):
     """
     Serializer for the JobType model.
@@ -79,6 +147,7 @@ class JobTypeSerializer(serializers.ModelSerializer):
         fields = [
             "name",
         ]
+        list_serializer_class = NameListSerializer
 
 
 class SkillSerializer(serializers.ModelSerializer):
@@ -91,9 +160,10 @@ class SkillSerializer(serializers.ModelSerializer):
         fields = [
             "name",
         ]
+        list_serializer_class = NameListSerializer
 
 
-class TalentSerializer(serializers.ModelSerializer):
+class TalentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer class for the Talent model.
 
@@ -103,7 +173,7 @@ class TalentSerializer(serializers.ModelSerializer):
 
     Attributes:
         timezone (TimeZoneSerializerField): Serializer field for the timezone.
-        skills (serializers.StringRelatedField): Serializer field for the skills.
+        skills (serializers.SlugRelatedField): Serializer field for the skill names.
 
     Meta:
         model (Talent): The model class that the serializer corresponds to.
@@ -111,7 +181,7 @@ class TalentSerializer(serializers.ModelSerializer):
     """
 
     timezone = TimeZoneSerializerField(use_pytz=True)
-    skills = serializers.StringRelatedField(many=True)
+    skills = serializers.SlugRelatedField(slug_field="name", many=True, read_only=True)
 
     class Meta:
         model = Talent
@@ -132,59 +202,71 @@ class TalentSerializer(serializers.ModelSerializer):
             "discord_profile",
             "twitter_profile",
             "phone_number",
-            "skills",  # Problem Outputs a list of skills pk instead of the skill name
+            "skills",
         ]
+        read_only_fields = fields
+
 
+class TalentFieldSerializer(serializers.Serializer):
+    """
+    Base serializer for updating a single field of the Talent model.
 
-class LanguageSerializer(serializers.ModelSerializer):
+    Subclasses declare the field explicitly, so no model introspection is
+    needed, and only the updated column (and `updated_at`) is written to the
+    database.
+    """
+
+    def update(self, instance, validated_data):
+        if not validated_data:
+            # Nothing was sent in a partial update
+            return instance
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
+
+class LanguageSerializer(TalentFieldSerializer):
     """
     Serializer for the 'language' field of the Talent model.
     """
 
     language = serializers.CharField(max_length=200)
 
-    class Meta:
-        model = Talent
-        fields = [
-            "language",
-        ]
-
 
-class TimeZoneSerializer(serializers.ModelSerializer):
+class TimeZoneSerializer(TalentFieldSerializer):
     """
     Serializer for the 'timezone' field of the Talent model.
     """
 
     timezone = TimeZoneSerializerField(use_pytz=True)
 
-    class Meta:
-        model = Talent
-        fields = [
-            "timezone",
-        ]
-
 
-class AvatarSerializer(serializers.Serializer):
+class AvatarSerializer(TalentFieldSerializer):
     """
     Serializer for the 'avatar' field of the Talent model.
     """
 
     avatar = serializers.ImageField()
 
-    def save(self, instance):
+    def update(self, instance, validated_data):
         """
-        Save method for the serializer.
+        Upload the avatar image and save its URL to the talent.
 
         Args:
-            instance: The instance of the model to be saved.
+            instance: The talent to be updated.
+            validated_data (dict): The validated data, holding the image.
 
         Returns:
-            None
+            Talent: The updated talent.
 
         Raises:
             serializers.ValidationError: If the image upload fails.
         """
-        image = self.validated_data["avatar"]
+        if "avatar" not in validated_data:
+            # No file was sent in a partial update
+            return instance
+        image = validated_data["avatar"]
 
         try:
             # Upload the image to the image server (e.g., Cloudinary)
@@ -194,53 +276,34 @@ class AvatarSerializer(serializers.Serializer):
             raise serializers.ValidationError("Image upload failed")
 
         # Save the avatar URL to the Talent model
-        instance.avatar = avatar_url
-        instance.save()
+        return super().update(instance, {"avatar": avatar_url})
 
 
-class UsernameSerializer(serializers.ModelSerializer):
+class UsernameSerializer(TalentFieldSerializer):
     """
     Serializer for the 'username' field of the Talent model.
     """
 
     username = serializers.CharField(max_length=200)
 
-    class Meta:
-        model = Talent
-        fields = [
-            "username",
-        ]
-
 
-class AboutMeSerializer(serializers.ModelSerializer):
+class AboutMeSerializer(TalentFieldSerializer):
     """
     Serializer for the 'about_me' field of the Talent model.
     """
 
     about_me = serializers.CharField(max_length=200)
 
-    class Meta:
-        model = Talent
-        fields = [
-            "about_me",
-        ]
-
 
-class SummarySerializer(serializers.ModelSerializer):
+class SummarySerializer(TalentFieldSerializer):
     """
     Serializer for the 'summary' field of the Talent model.
     """
 
     summary = serializers.CharField(max_length=200)
 
-    class Meta:
-        model = Talent
-        fields = [
-            "summary",
-        ]
-
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer class for the Review model.
     """
@@ -260,7 +323,7 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
 
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Experience model.
 
@@ -283,7 +346,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
         ]
 
 
-class ExperienceOutputSerializer(serializers.ModelSerializer):
+class ExperienceOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer class for Experience model to output data.
     """
@@ -304,3 +367,4 @@ class ExperienceOutputSerializer(serializers.ModelSerializer):
             "twitter_link",
             "talent",
         ]
+        read_only_fields = fields
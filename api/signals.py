@@ -0,0 +1,95 @@
+from django.db.models import Avg
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from jobs.models import Job
+from talents.models import Experience, Review, Talent
+from .caching import invalidate_list_cache
+
+
+@receiver(pre_save, sender=Review)
+def remember_reviewed_talent(sender, instance, **kwargs):
+    """
+    Remember the talent a review belonged to before it is saved, so that
+    moving a review to another talent also updates the previous one.
+    """
+    instance._previous_talent_id = (
+        None
+        if instance._state.adding
+        else Review.objects.filter(pk=instance.pk)
+        .values_list("talent_id", flat=True)
+        .first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Review)
+def update_talent_average_rating(sender, instance, **kwargs):
+    """
+    Recompute the denormalized average rating of the reviewed talent, and of
+    the talent the review was moved from, if any.
+    """
+    talent_ids = {instance.talent_id, getattr(instance, "_previous_talent_id", None)}
+    for talent_id in talent_ids - {None}:
+        average_rating = Review.objects.filter(talent_id=talent_id).aggregate(
+            average_rating=Avg("rating")
+        )["average_rating"]
+        Talent.objects.filter(pk=talent_id).update(
+            average_rating=average_rating or 0.0
+        )
+
+
+# Talent columns that no cached page renders. Authentication saves them on
+# every request, which must not flush the list caches.
+UNRENDERED_TALENT_FIELDS = frozenset({"signed_in_with"})
+
+
+@receiver([post_save, post_delete], sender=Talent)
+@receiver(m2m_changed, sender=Talent.skills.through)
+def invalidate_talent_list(sender, update_fields=None, **kwargs):
+    """
+    Drop the cached talent list pages, and the review list pages showing the
+    talent's username, when a talent or its skills change.
+    """
+    if update_fields and update_fields <= UNRENDERED_TALENT_FIELDS:
+        return
+    invalidate_list_cache("talents")
+    invalidate_list_cache("reviews")
+
+
+@receiver(m2m_changed, sender=Talent.skills.through)
+@receiver(m2m_changed, sender=Job.job_types.through)
+def touch_updated_at(sender, instance, action, reverse, **kwargs):
+    """
+    Bump the `updated_at` of a talent or job whose skills or job types
+    changed, since related managers do not save the instance itself.
+    """
+    if reverse or action not in ("post_add", "post_remove", "post_clear"):
+        return
+    type(instance).objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+
+
+@receiver([post_save, post_delete], sender=Review)
+def invalidate_review_list(sender, **kwargs):
+    """
+    Drop the cached review list pages, and the talent list pages sorted by
+    rating, when a review changes.
+    """
+    invalidate_list_cache("reviews")
+    invalidate_list_cache("talents")
+
+
+@receiver([post_save, post_delete], sender=Experience)
+def invalidate_experience_list(sender, **kwargs):
+    """
+    Drop the cached experience list pages when an experience changes.
+    """
+    invalidate_list_cache("experiences")
+
+
+@receiver([post_save, post_delete], sender=Job)
+@receiver(m2m_changed, sender=Job.job_types.through)
+def invalidate_job_list(sender, **kwargs):
+    """
+    Drop the cached job list pages when a job or its job types change.
+    """
+    invalidate_list_cache("jobs")
@@ -1,3 +1,591 @@
-from django.test import TestCase
+import datetime
+import decimal
+import uuid
+from datetime import timedelta
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from jobs.models import Company, Job, JobType
+from .renderers import ORJSONRenderer
+from .serializers import ReviewSerializer, TalentSerializer
+from talents.models import Review, Skill, Talent
+
+
+class APITestCase(TestCase):
+    def setUp(self):
+        # Cached list pages outlive the test transaction, so start empty
+        cache.clear()
+        self.client = APIClient()
+        self.talent = Talent.objects.create(
+            avatar="https://example.com/avatar.png",
+            username="talent",
+            about_me="About me",
+            summary="Summary",
+        )
+        self.company = Company.objects.create(
+            name="Company",
+            email="company@example.com",
+            logo="https://example.com/logo.png",
+        )
+
+
+class CachedListTests(APITestCase):
+    def test_review_list_is_invalidated_by_review_save(self):
+        url = reverse("review-list")
+        self.assertEqual(self.client.get(url).json(), [])
+
+        Review.objects.create(
+            talent=self.talent,
+            reviewer_name="Reviewer",
+            reviewer_organization=self.company,
+            rating=5,
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_review_list_is_invalidated_by_talent_save(self):
+        Review.objects.create(
+            talent=self.talent,
+            reviewer_name="Reviewer",
+            reviewer_organization=self.company,
+            rating=5,
+        )
+        url = reverse("review-list")
+        self.assertEqual(self.client.get(url).json()[0]["talent_username"], "talent")
+
+        self.talent.username = "renamed"
+        self.talent.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.json()[0]["talent_username"], "renamed")
+
+    def test_login_save_keeps_cached_lists(self):
+        url = reverse("talent-list")
+        cached = self.client.get(url).json()
+        updated_at = self.talent.updated_at
+        # Bypasses the signals, so only an invalidation would show the change
+        Talent.objects.filter(pk=self.talent.pk).update(username="renamed")
+
+        self.talent.signed_in_with = "Discord"
+        self.talent.save(update_fields=["signed_in_with"])
+
+        self.assertEqual(self.client.get(url).json(), cached)
+        self.talent.refresh_from_db()
+        self.assertEqual(self.talent.updated_at, updated_at)
+
+    def test_cached_list_still_authenticates(self):
+        url = reverse("job-list")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token bogus")
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TouchUpdatedAtTests(APITestCase):
+    def test_setting_skills_bumps_updated_at(self):
+        stale = timezone.now() - timedelta(days=1)
+        Talent.objects.filter(pk=self.talent.pk).update(updated_at=stale)
+        skill = Skill.objects.create(name="Moderator")
+
+        self.talent.skills.set([skill])
+
+        self.talent.refresh_from_db()
+        self.assertGreater(self.talent.updated_at, stale)
+
+
+class JobListPermissionTests(APITestCase):
+    def test_talent_cannot_create_job(self):
+        self.client.force_authenticate(user=self.talent)
+
+        response = self.client.post(
+            reverse("job-list"),
+            {
+                "job_logo": "https://example.com/logo.png",
+                "job_link": "https://example.com/job",
+                "job_title": "Moderator",
+                "job_description": "Description",
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AverageRatingTests(APITestCase):
+    def create_review(self, talent, rating):
+        company = Company.objects.create(
+            name="Reviewer",
+            email=f"reviewer{Company.objects.count()}@example.com",
+            logo="https://example.com/logo.png",
+        )
+        return Review.objects.create(
+            talent=talent,
+            reviewer_name="Reviewer",
+            reviewer_organization=company,
+            rating=rating,
+        )
+
+    def get_average_rating(self, talent):
+        url = reverse("average-rating", kwargs={"pk": talent.pk})
+        return self.client.get(url).json()["average_rating"]
+
+    def test_talent_without_reviews_has_no_average_rating(self):
+        self.assertIsNone(self.get_average_rating(self.talent))
+
+    def test_average_rating_follows_reviews(self):
+        self.create_review(self.talent, 4)
+        review = self.create_review(self.talent, 2)
+        self.assertEqual(self.get_average_rating(self.talent), 3.0)
+
+        review.delete()
+
+        self.assertEqual(self.get_average_rating(self.talent), 4.0)
+
+    def test_moving_a_review_updates_both_talents(self):
+        other = Talent.objects.create(
+            avatar="https://example.com/avatar.png", about_me="", summary=""
+        )
+        self.create_review(self.talent, 4)
+        review = self.create_review(self.talent, 2)
+
+        review.talent = other
+        review.save()
+
+        self.assertEqual(self.get_average_rating(self.talent), 4.0)
+        self.assertEqual(self.get_average_rating(other), 2.0)
+
+    def test_unknown_talent_is_not_found(self):
+        url = reverse("average-rating", kwargs={"pk": 0})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TalentPaginationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        # Runs of equal ratings longer than a page, split by id order
+        for rating in (5.0, 5.0, 5.0, 3.5, 0.0, 0.0, 0.0, 0.0):
+            talent = Talent.objects.create(
+                avatar="https://example.com/avatar.png", about_me="", summary=""
+            )
+            Talent.objects.filter(pk=talent.pk).update(average_rating=rating)
+
+    def get_all_pages(self, **params):
+        response = self.client.get(reverse("talent-list"), {"page_size": 2, **params})
+        pages = [response.json()]
+        while pages[-1]["next"]:
+            pages.append(self.client.get(pages[-1]["next"]).json())
+        return pages
+
+    def get_ids(self, pages):
+        return [talent["id"] for page in pages for talent in page["results"]]
+
+    def test_pages_by_id(self):
+        pages = self.get_all_pages()
+
+        expected = list(Talent.objects.order_by("-id").values_list("id", flat=True))
+        self.assertEqual(self.get_ids(pages), expected)
+        self.assertEqual({page["count"] for page in pages}, {len(expected)})
+
+    def test_pages_through_tied_ratings(self):
+        for sort_by, ordering in (
+            ("most_experienced", ("-average_rating", "-id")),
+            ("least_experienced", ("average_rating", "id")),
+        ):
+            with self.subTest(sort_by=sort_by):
+                pages = self.get_all_pages(sort_by=sort_by)
+
+                expected = Talent.objects.order_by(*ordering).values_list(
+                    "id", flat=True
+                )
+                self.assertEqual(self.get_ids(pages), list(expected))
+
+    def test_pages_back_through_tied_ratings(self):
+        pages = self.get_all_pages(sort_by="most_experienced")
+
+        backwards = [pages[-1]]
+        while backwards[-1]["previous"]:
+            backwards.append(self.client.get(backwards[-1]["previous"]).json())
+        self.assertEqual(
+            [self.get_ids([page]) for page in backwards[::-1]],
+            [self.get_ids([page]) for page in pages],
+        )
+
+    def test_count_follows_filters_and_invalidation(self):
+        skill = Skill.objects.create(name="Moderator")
+        url = reverse("talent-list")
+        self.assertEqual(
+            self.client.get(url, {"skills": "moderator"}).json()["count"], 0
+        )
+
+        self.talent.skills.add(skill)
+
+        self.assertEqual(
+            self.client.get(url, {"skills": "moderator"}).json()["count"], 1
+        )
+        self.assertEqual(self.client.get(url).json()["count"], Talent.objects.count())
+
+
+class CachedFieldsTests(APITestCase):
+    def test_instances_get_their_own_bound_fields(self):
+        first, second = TalentSerializer(), TalentSerializer()
+
+        for name, field in first.fields.items():
+            with self.subTest(field=name):
+                self.assertIsNot(field, second.fields[name])
+                self.assertIs(field.parent, first)
+                self.assertIs(second.fields[name].parent, second)
+        skills = first.fields["skills"]
+        self.assertIsNot(skills.child_relation, second.fields["skills"].child_relation)
+        self.assertIs(skills.child_relation.parent, skills)
+
+    def test_cached_fields_serialize(self):
+        self.talent.skills.set([Skill.objects.create(name="Moderator")])
+        review = Review.objects.create(
+            talent=self.talent,
+            reviewer_name="Reviewer",
+            reviewer_organization=self.company,
+            rating=5,
+        )
+
+        for _ in range(2):
+            self.assertEqual(
+                TalentSerializer(self.talent).data["skills"], ["Moderator"]
+            )
+            self.assertEqual(ReviewSerializer(review).data["talent_username"], "talent")
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_drf_json(self):
+        data = {
+            "datetime": datetime.datetime(
+                2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+            ),
+            "naive_datetime": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "date": datetime.date(2024, 1, 2),
+            "time": datetime.time(3, 4, 5, 678901),
+            "timedelta": timedelta(hours=1),
+            "decimal": decimal.Decimal("4.50"),
+            "uuid": uuid.UUID(int=1),
+            "lazy": gettext_lazy("Hello"),
+            "non_str_keys": {1: "one", None: "none", True: "true"},
+            "float": 4.5,
+            "unicode": "caf\u00e9 \u2028 \u2029",
+            "list": [1, None, False],
+        }
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_renders_nan_as_null(self):
+        # DRF's strict JSON raises ValueError instead
+        rendered = ORJSONRenderer().render({"rating": float("nan")})
+
+        self.assertEqual(rendered, b'{"rating":null}')
+
+    def test_link_payloads_are_rendered_alike(self):
+        response = self.client.get(reverse("api-root"))
+
+        self.assertEqual(response.content, ORJSONRenderer().render(response.json()))
+
+
+class JobListTests(APITestCase):
+    def create_job(self, *job_types):
+        job = Job.objects.create(
+            job_logo="https://example.com/logo.png",
+            job_link="https://example.com/job",
+            company=self.company,
+            job_title="Moderator",
+            job_description="Description",
+        )
+        job.job_types.set(
+            JobType.objects.get_or_create(name=name)[0] for name in job_types
+        )
+        return job
+
+    def test_company_creates_job(self):
+        self.client.force_authenticate(user=self.company)
+
+        response = self.client.post(
+            reverse("job-list"),
+            {
+                "job_logo": "https://example.com/logo.png",
+                "job_link": "https://example.com/job",
+                "job_title": "Moderator",
+                "job_description": "Description",
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Job.objects.get().company, self.company)
+
+    def test_filters_by_job_types_without_duplicates(self):
+        both = self.create_job("Moderator", "Marketer")
+        self.create_job("Influencer")
+
+        response = self.client.get(
+            reverse("job-list"), {"job_types": ["moderator", "MARKETER"]}
+        )
+
+        body = response.json()
+        self.assertEqual(body["count"], 1)
+        self.assertEqual([job["id"] for job in body["results"]], [both.pk])
+        self.assertEqual(
+            sorted(body["results"][0]["job_types"]), ["Marketer", "Moderator"]
+        )
+
+
+class ConditionalGetTests(APITestCase):
+    def assert_etag_changes(self, url, change):
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        change()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_talent_detail_etag_follows_profile_visits(self):
+        url = reverse("talent-detail", kwargs={"pk": self.talent.pk})
+        self.assert_etag_changes(url, self.talent.increment_profile_visits)
+
+    def test_talent_detail_counts_visit_before_etag(self):
+        url = reverse("talent-detail", kwargs={"pk": self.talent.pk})
+        session = self.client.session
+        session.save()
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.json()["profile_visits"], 1)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_review_detail_etag_follows_talent_username(self):
+        review = Review.objects.create(
+            talent=self.talent,
+            reviewer_name="Reviewer",
+            reviewer_organization=self.company,
+            rating=5,
+        )
+
+        def rename():
+            self.talent.username = "renamed"
+            self.talent.save()
+
+        url = reverse("review-detail", kwargs={"pk": review.pk})
+        self.assert_etag_changes(url, rename)
+
+    def test_job_detail_etag_follows_job_types(self):
+        job = Job.objects.create(
+            job_logo="https://example.com/logo.png",
+            job_link="https://example.com/job",
+            company=self.company,
+            job_title="Moderator",
+            job_description="Description",
+        )
+
+        def add_job_type():
+            job.job_types.add(JobType.objects.create(name="Moderator"))
+
+        url = reverse("job-detail", kwargs={"pk": job.pk})
+        self.assert_etag_changes(url, add_job_type)
+
+    def test_missing_object_is_not_found(self):
+        response = self.client.get(reverse("job-detail", kwargs={"pk": 0}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_index_answers_conditional_get(self):
+        etag = self.client.get(reverse("index"))["ETag"]
+
+        response = self.client.get(reverse("index"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class TalentDetailPermissionTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.other = Talent.objects.create(
+            avatar="https://example.com/avatar.png", about_me="", summary=""
+        )
+
+    def delete(self, talent):
+        return self.client.delete(reverse("talent-detail", kwargs={"pk": talent.pk}))
+
+    def test_talent_deletes_own_profile(self):
+        self.client.force_authenticate(user=self.talent)
+
+        response = self.delete(self.talent)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Talent.objects.filter(pk=self.talent.pk).exists())
+
+    def test_talent_cannot_delete_other_profile(self):
+        self.client.force_authenticate(user=self.talent)
+
+        response = self.delete(self.other)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(Talent.objects.filter(pk=self.other.pk).exists())
+
+    def test_company_cannot_delete_talent_with_same_pk(self):
+        pk = max(self.talent.pk, self.other.pk, self.company.pk) + 1
+        talent = Talent.objects.create(
+            pk=pk, avatar="https://example.com/avatar.png", about_me="", summary=""
+        )
+        company = Company.objects.create(
+            pk=pk, name="Other", email="other@example.com", logo="https://e.com/o.png"
+        )
+        self.client.force_authenticate(user=company)
+
+        response = self.delete(talent)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TalentFieldUpdateTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=self.talent)
+        self.url = reverse("about-me", kwargs={"pk": self.talent.pk})
+
+    def test_updates_only_the_field(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.url, {"about_me": "New"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"about_me": "New"})
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"about_me"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+        self.assertNotIn('"summary"', updates[0])
+        self.talent.refresh_from_db()
+        self.assertEqual(self.talent.about_me, "New")
+
+    def test_empty_partial_update_writes_nothing(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any(q["sql"].startswith("UPDATE") for q in queries))
+
+    def test_other_talent_is_forbidden(self):
+        other = Talent.objects.create(
+            avatar="https://example.com/avatar.png", about_me="", summary=""
+        )
+        url = reverse("about-me", kwargs={"pk": other.pk})
+
+        response = self.client.put(url, {"about_me": "New"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_missing_talent_is_not_found(self):
+        url = reverse("about-me", kwargs={"pk": 0})
+
+        response = self.client.put(url, {"about_me": "New"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class NameListViewTests(APITestCase):
+    def put_skills(self, names, talent=None):
+        url = reverse("skill-list", kwargs={"pk": (talent or self.talent).pk})
+        return self.client.put(url, {"name": names}, format="json")
+
+    def test_talent_sets_skills(self):
+        self.client.force_authenticate(user=self.talent)
+        Skill.objects.create(name="Moderator")
+
+        response = self.put_skills(["Moderator", "Marketer"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            response.json(), [{"name": "Moderator"}, {"name": "Marketer"}]
+        )
+        self.assertEqual(Skill.objects.count(), 2)
+        url = reverse("skill-list", kwargs={"pk": self.talent.pk})
+        self.client.force_authenticate(user=None)
+        self.assertCountEqual(
+            self.client.get(url).json(), [{"name": "Moderator"}, {"name": "Marketer"}]
+        )
+
+    def test_rejects_more_than_five_skills(self):
+        self.client.force_authenticate(user=self.talent)
+
+        response = self.put_skills([f"Skill {i}" for i in range(6)])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Skill.objects.exists())
+
+    def test_rejects_empty_names(self):
+        self.client.force_authenticate(user=self.talent)
+
+        for names in (["Moderator", " "], [""], [None]):
+            with self.subTest(names=names):
+                response = self.put_skills(names)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Skill.objects.exists())
+
+    def test_talent_cannot_set_other_skills(self):
+        other = Talent.objects.create(
+            avatar="https://example.com/avatar.png", about_me="", summary=""
+        )
+        self.client.force_authenticate(user=self.talent)
+
+        response = self.put_skills(["Moderator"], talent=other)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_company_sets_job_types(self):
+        job = Job.objects.create(
+            job_logo="https://example.com/logo.png",
+            job_link="https://example.com/job",
+            company=self.company,
+            job_title="Moderator",
+            job_description="Description",
+        )
+        url = reverse("job-type", kwargs={"pk": job.pk})
+        self.client.force_authenticate(user=self.company)
+
+        response = self.client.put(url, {"name": [""]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.put(url, {"name": ["Moderator"]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [{"name": "Moderator"}])
+
+    def test_company_cannot_set_other_job_types(self):
+        other = Company.objects.create(
+            name="Other", email="other@example.com", logo="https://example.com/o.png"
+        )
+        job = Job.objects.create(
+            job_logo="https://example.com/logo.png",
+            job_link="https://example.com/job",
+            company=other,
+            job_title="Moderator",
+            job_description="Description",
+        )
+        self.client.force_authenticate(user=self.company)
+
+        response = self.client.put(
+            reverse("job-type", kwargs={"pk": job.pk}),
+            {"name": ["Moderator"]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1,5 +1,4 @@
-from django.urls import path
-from rest_framework.urlpatterns import format_suffix_patterns
+from django.urls import URLPattern, include, path
 from .views import (
     TalentList,
     TalentDetail,
@@ -21,29 +20,42 @@ from .views import (
     Timezone,
 )
 
+talent_patterns = [
+    path("", TalentDetail.as_view(), name="talent-detail"),
+    path("skills/", SkillView.as_view(), name="skill-list"),
+    path("about-me/", AboutMe.as_view(), name="about-me"),
+    path("summary/", Summary.as_view(), name="summary"),
+    path("username/", Username.as_view(), name="username"),
+    path("average-rating/", get_talent_average_rating, name="average-rating"),
+    path("avatar/", UploadAvatar.as_view(), name="avatar"),
+    path("language/", Language.as_view(), name="language"),
+    path("timezone/", Timezone.as_view(), name="timezone"),
+]
+
+job_patterns = [
+    path("", JobDetail.as_view(), name="job-detail"),
+    path("job_type/", JobTypeView.as_view(), name="job-type"),
+]
+
+# Routes sharing a "<resource>/<int:pk>/" prefix are nested so the prefix is
+# matched once instead of once per sub-resource. Patterns are tried in order,
+# so the most requested resources come first and the API root comes last.
 urlpatterns = [
-    path("", APIRoot.as_view(), name="api-root"),
+    path("talent/<int:pk>/", include(talent_patterns)),
     path("talent/", TalentList.as_view(), name="talent-list"),
-    path("talent/<int:pk>/", TalentDetail.as_view(), name="talent-detail"),
-    path("talent/<int:pk>/skills/", SkillView.as_view(), name="skill-list"),
-    path("talent/<int:pk>/about-me/", AboutMe.as_view(), name="about-me"),
-    path("talent/<int:pk>/summary/", Summary.as_view(), name="summary"),
-    path("talent/<int:pk>/username/", Username.as_view(), name="username"),
-    path(
-        "talent/<int:pk>/average-rating/",
-        get_talent_average_rating,
-        name="average-rating",
-    ),
-    path("talent/<int:pk>/avatar/", UploadAvatar.as_view(), name="avatar"),
-    path("talent/<int:pk>/language/", Language.as_view(), name="language"),
-    path("talent/<int:pk>/timezone/", Timezone.as_view(), name="timezone"),
+    path("job/<int:pk>/", include(job_patterns)),
     path("job/", JobList.as_view(), name="job-list"),
-    path("job/<int:pk>/", JobDetail.as_view(), name="job-detail"),
-    path("job/<int:pk>/job_type/", JobTypeView.as_view(), name="job-type"),
-    path("experience/", ExperienceList.as_view(), name="experience-list"),
     path("experience/<int:pk>/", ExperienceDetail.as_view(), name="experience-detail"),
-    path("review/", ReviewList.as_view(), name="review-list"),
+    path("experience/", ExperienceList.as_view(), name="experience-list"),
     path("review/<int:pk>/", ReviewDetail.as_view(), name="review-detail"),
+    path("review/", ReviewList.as_view(), name="review-list"),
+    path("", APIRoot.as_view(), name="api-root"),
 ]
 
-urlpatterns = format_suffix_patterns(urlpatterns)
+# Fail at import time if a route is registered twice
+_route_names = [
+    pattern.name
+    for pattern in (*urlpatterns, *talent_patterns, *job_patterns)
+    if isinstance(pattern, URLPattern)
+]
+assert len(set(_route_names)) == len(_route_names), "Duplicate route names in api.urls"
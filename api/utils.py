@@ -0,0 +1,54 @@
+import hashlib
+from functools import lru_cache
+
+import orjson
+from django.urls import reverse
+
+
+def render_links(request, routes, **fields):
+    """
+    Render a JSON body linking to named routes with absolute URLs.
+
+    Args:
+        request (HttpRequest): The request, whose scheme and host prefix the URLs.
+        routes (dict): Maps each key of the body to the name of a route.
+        **fields: Constant values to include in the body before the links.
+
+    Returns:
+        bytes: The encoded JSON body.
+    """
+    origin = f"{request.scheme}://{request.get_host()}"
+    return _render_links(origin, tuple(routes.items()), tuple(fields.items()))
+
+
+def links_etag(request, routes, **fields):
+    """
+    Return the ETag of the body rendered by `render_links`.
+    """
+    return _links_etag(render_links(request, routes, **fields))
+
+
+@lru_cache(maxsize=32)
+def _render_links(origin, routes, fields):
+    # The body only depends on the origin and the routes, so the URLs are
+    # reversed and encoded once per origin and reused by later requests.
+    payload = dict(fields)
+    payload.update((key, origin + reverse(name)) for key, name in routes)
+    # Encoded like the responses of ORJSONRenderer
+    return orjson.dumps(payload)
+
+
+@lru_cache(maxsize=32)
+def _links_etag(content):
+    return hashlib.md5(content).hexdigest()
+
+
+def warm_url_resolver():
+    """
+    Import the URLconf and build the resolver's lookup tables.
+
+    Called from the WSGI and ASGI entry points, so each worker does it at
+    startup rather than while serving its first request. Management commands
+    never load those modules, so a broken view cannot break them.
+    """
+    reverse("api-root")
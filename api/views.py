@@ -1,4 +1,13 @@
-from django.db.models import Q, Avg
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.functions import Lower
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 from django.views.decorators.csrf import csrf_exempt
 from oauth2.auth import DiscordOrTwitterAuthentication
 from .openapi_extensions import (
@@ -7,7 +16,7 @@ from .openapi_extensions import (
     TwitterAuthenticationScheme,
 )
 from talents.models import Skill, Talent, Review, Experience
-from jobs.models import Job, Company, JobType
+from jobs.models import Job, JobType
 from .serializers import (
     AboutMeSerializer,
     AvatarSerializer,
@@ -25,33 +34,272 @@ from .serializers import (
     CustomSerializer,
     JobTypeSerializer,
 )
-from .permissions import IsTalentOrReadOnly, IsCompanyOrReadOnly
+from .caching import CachedListMixin, list_cache_prefix, updated_at_etag
+from .utils import render_links
+from .permissions import (
+    SAFE_METHODS,
+    IsCompany,
+    IsCompanyOrReadOnly,
+    IsSelfOrReadOnly,
+    IsTalent,
+    IsTalentOrReadOnly,
+    ReadOnly,
+)
 from rest_framework.authentication import TokenAuthentication
-from rest_framework import generics, permissions, status
+from rest_framework import generics, status
 from rest_framework.decorators import api_view, authentication_classes
 from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.response import Response
-from rest_framework.reverse import reverse
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
 
+class AnonymousReadMixin:
+    """
+    Mixin for views that do not authenticate safe (read-only) requests.
+
+    The authenticators used for writes hold no per-request state, so they are
+    built once per view class and reused.
+    """
+
+    def get_authenticators(self):
+        if self.request is None or self.request.method in SAFE_METHODS:
+            return ()
+        cls = type(self)
+        if "_write_authenticators" not in cls.__dict__:
+            cls._write_authenticators = tuple(super().get_authenticators())
+        return cls._write_authenticators
+
+
 # Define an API root view to display available endpoints
-class DefaultPagination(PageNumberPagination):
+class DefaultPagination(CursorPagination):
     """
     Default pagination class for API views.
 
+    Pages are located by a cursor on the ordering field instead of an offset,
+    so deep pages cost the same as the first one. Responses also carry the
+    total 'count' of results, as the search results spec requires.
+
     Attributes:
+        ordering (str): The field the results are ordered and paged by.
         page_size (int): The number of items to include on each page.
         page_size_query_param (str): The query parameter to control the page size.
         max_page_size (int): The maximum allowed page size.
     """
 
-    page_size = 300
+    ordering = "-id"
+    page_size = 50
     page_size_query_param = "page_size"
-    max_page_size = 1000
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = self.get_count(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_count(self, queryset, request, view):
+        """
+        Return the total number of results, counted once per listing.
+
+        Every page of a listing has the same count, so for cached list views
+        it is cached under the view's namespace, keyed by the query string
+        without the paging parameters, and invalidated along with the pages.
+        Other views count on every page.
+        """
+        namespace = getattr(view, "cache_namespace", None)
+        if namespace is None:
+            return queryset.count()
+        params = request.query_params.copy()
+        params.pop(self.cursor_query_param, None)
+        params.pop(self.page_size_query_param, None)
+        listing = hashlib.md5(params.urlencode().encode()).hexdigest()
+        key = f"{list_cache_prefix(namespace)}:count:{listing}"
+        return cache.get_or_set(key, queryset.count, view.cache_timeout)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"] = {
+            "count": {"type": "integer", "example": 123},
+            **schema["properties"],
+        }
+        return schema
+
+
+class TalentPagination(DefaultPagination):
+    """
+    Pagination class for talents, ordered by the 'sort_by' query parameter.
+
+    Sorting by experience pages by the denormalized average rating of the
+    talents, with the id breaking ties.
+
+    DRF cursors only filter on the first ordering field and fall back to an
+    offset within runs of equal values, which skips rows when paging
+    backwards. The average rating has long runs of equal values (e.g. every
+    talent without reviews), so sorted cursors hold the rating and the id of
+    their position instead, which is unique. A rating that changes between
+    requests can still make a talent skip or repeat across pages.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        sort_by = request.query_params.get("sort_by")
+        if sort_by == "most_experienced":
+            return ("-average_rating", "-id")
+        if sort_by == "least_experienced":
+            return ("average_rating", "id")
+        return super().get_ordering(request, queryset, view)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = self.get_ordering(request, queryset, view)
+        cursor = super().decode_cursor(request)
+        if len(ordering) == 1 or cursor is None or cursor.position is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        # Filter on both fields here, and let DRF page from the filtered rows
+        try:
+            rating, pk = (float(value) for value in cursor.position.split(","))
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        descending = ordering[0].startswith("-")
+        lookup = "lt" if descending != cursor.reverse else "gt"
+        queryset = queryset.filter(
+            Q(**{f"average_rating__{lookup}": rating})
+            | Q(average_rating=rating, **{f"id__{lookup}": pk})
+        )
+        page = super().paginate_queryset(queryset, request, view)
+
+        # DRF saw no position, so restore the one the page was taken after
+        if cursor.reverse:
+            self.has_next, self.next_position = True, cursor.position
+        else:
+            self.has_previous, self.previous_position = True, cursor.position
+        return page
+
+    def decode_cursor(self, request):
+        cursor = super().decode_cursor(request)
+        if cursor is None or len(self.ordering) == 1:
+            return cursor
+        # Sorted positions are applied by paginate_queryset
+        return cursor._replace(position=None)
+
+    def _get_position_from_instance(self, instance, ordering):
+        if len(ordering) == 1:
+            return super()._get_position_from_instance(instance, ordering)
+        return f"{instance.average_rating},{instance.pk}"
+
+
+def _get_or_create_by_name(model, names):
+    """
+    Return the instances of a model named in `names`, creating missing ones.
+
+    Existing rows are fetched with one query and the missing ones are inserted
+    with a single bulk INSERT, instead of a get_or_create() per name.
+
+    Args:
+        model (Model): A model with a unique `name` field.
+        names (Iterable[str]): The names to look up.
+
+    Returns:
+        list: The model instances, one per distinct name.
+    """
+    names = set(names)
+    instances = list(model.objects.filter(name__in=names))
+    missing = names - {instance.name for instance in instances}
+    if missing:
+        model.objects.bulk_create(
+            [model(name=name) for name in missing], ignore_conflicts=True
+        )
+        # Conflicting rows get no primary key back, so read them all again
+        instances += model.objects.filter(name__in=missing)
+    return instances
+
+
+def _serialized_columns(serializer_class):
+    """
+    Return the model fields rendered by a model serializer, for `only()`.
+
+    Many-to-many fields and serializer-declared fields are left out, since
+    they are not columns of the model's table.
+
+    Args:
+        serializer_class (ModelSerializer): The serializer class.
+
+    Returns:
+        list: The names of the rendered concrete fields.
+    """
+    meta = serializer_class.Meta
+    columns = {field.name for field in meta.model._meta.concrete_fields}
+    return [field for field in meta.fields if field in columns]
+
+
+def _get_names(data):
+    """
+    Return the list of names sent in a request body.
+
+    Form and multipart bodies repeat the `name` key, while JSON bodies carry a
+    list (or a single string) under it.
+
+    Args:
+        data (QueryDict | dict): The parsed request data.
 
+    Returns:
+        list: The names, in the order they were sent.
+    """
+    if hasattr(data, "getlist"):
+        return data.getlist("name")
+    names = data.get("name", [])
+    return [names] if isinstance(names, str) else list(names)
 
+
+def _invalid_names_response(names, max_names=None):
+    """
+    Return a 400 response if the names are not valid, otherwise None.
+
+    The names are checked in memory so that invalid requests are rejected
+    before any database work.
+
+    Args:
+        names (list): The names sent in the request.
+        max_names (int, optional): The maximum number of names allowed.
+
+    Returns:
+        Response | None: The error response, or None if the names are valid.
+    """
+    if max_names is not None and len(names) > max_names:
+        return Response(
+            {"detail": f"You can only select a maximum of {max_names} skills."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if not all(isinstance(name, str) and name.strip() for name in names):
+        return Response(
+            {"detail": "Names must be non-empty strings."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return None
+
+
+API_ROOT_ROUTES = {
+    "talents": "talent-list",
+    "jobs": "job-list",
+    "reviews": "review-list",
+    "experiences": "experience-list",
+}
+
+
+# The payload only changes with a deployment, so shared caches in front of the
+# app may serve it without reaching Django.
+@method_decorator(
+    [cache_control(public=True, max_age=300), vary_on_headers("Host")],
+    name="dispatch",
+)
 class APIRoot(generics.GenericAPIView):
     """
     API root view.
@@ -59,36 +307,28 @@ class APIRoot(generics.GenericAPIView):
     Returns a response with available API endpoints.
     """
 
+    # Describes the response in the OpenAPI schema
     serializer_class = CustomSerializer
     authentication_classes = []
 
-    def get(self, request, format=None):
+    def get(self, request):
         """
         Handle GET requests.
 
         Parameters:
         - request: The HTTP request object.
-        - format: The requested format for the response.
 
         Returns:
-        A Response object containing the available API endpoints.
-        """
-        serializer = CustomSerializer(
-            data={
-                "talents": reverse("talent-list", request=request, format=format),
-                "jobs": reverse("job-list", request=request, format=format),
-                "reviews": reverse("review-list", request=request, format=format),
-                "experiences": reverse(
-                    "experience-list", request=request, format=format
-                ),
-            }
+        An HttpResponse object containing the available API endpoints. The
+        pre-encoded body bypasses DRF's content negotiation and renderers.
+        """
+        return HttpResponse(
+            render_links(request, API_ROOT_ROUTES), content_type="application/json"
         )
-        serializer.is_valid(raise_exception=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 # Views for Job endpoints
-class JobList(generics.ListCreateAPIView):
+class JobList(CachedListMixin, generics.ListCreateAPIView):
     """
     API endpoint for listing and creating job instances.
 
@@ -98,8 +338,9 @@ class JobList(generics.ListCreateAPIView):
     queryset = Job.objects.all()
     serializer_class = JobInSerializer
     authentication_classes = [TokenAuthentication]
-    permission_classes = [IsAuthenticatedOrReadOnly]
+    permission_classes = [ReadOnly | IsCompany]
     pagination_class = DefaultPagination
+    cache_namespace = "jobs"
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -116,15 +357,18 @@ class JobList(generics.ListCreateAPIView):
         Returns:
             queryset (QuerySet): The filtered queryset of Job objects.
         """
-        queryset = Job.objects.all()
+        queryset = Job.objects.only(*_serialized_columns(JobOutSerializer)).with_types()
 
-        # Filter by job types if provided in query parameters
+        # Filter by job types if provided in query parameters. Names are matched
+        # case-insensitively with a single IN lookup, and distinct() drops the
+        # duplicate rows produced by the many-to-many join.
         job_types = self.request.query_params.getlist("job_types")
         if job_types:
-            query_condition = Q()
-            for job_type in job_types:
-                query_condition |= Q(job_types__name__iexact=job_type)
-            queryset = queryset.filter(query_condition)
+            queryset = (
+                queryset.alias(job_type_name=Lower("job_types__name"))
+                .filter(job_type_name__in=[job_type.lower() for job_type in job_types])
+                .distinct()
+            )
 
         return queryset
 
@@ -132,10 +376,8 @@ class JobList(generics.ListCreateAPIView):
         """
         Perform custom creation logic for the view.
 
-        This method is called when creating a new object using the view.
-        It checks if the request user is an instance of the Company model.
-        If not, it returns a 403 Forbidden response.
-        Otherwise, it saves the object with the company set to the request user.
+        Saves the object with the company set to the request user. Only
+        companies get this far (see permission_classes).
 
         Args:
             serializer: The serializer instance used for object creation.
@@ -143,11 +385,10 @@ class JobList(generics.ListCreateAPIView):
         Returns:
             None
         """
-        if not isinstance(self.request.user, Company):
-            return Response(status=status.HTTP_403_FORBIDDEN)
         serializer.save(company=self.request.user)
 
 
+@method_decorator(condition(etag_func=updated_at_etag(Job)), name="get")
 class JobDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, and delete individual job instances.
@@ -156,7 +397,7 @@ class JobDetail(generics.RetrieveUpdateDestroyAPIView):
     It retrieves a single job instance, updates its data, or deletes it from the database.
     """
 
-    queryset = Job.objects.all()
+    queryset = Job.objects.with_types()
     serializer_class = JobInSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsCompanyOrReadOnly]
     authentication_classes = [TokenAuthentication]
@@ -186,7 +427,7 @@ class JobTypeView(generics.RetrieveUpdateAPIView):
     """
 
     authentication_classes = [TokenAuthentication]
-    permission_classes = [IsAuthenticatedOrReadOnly]
+    permission_classes = [ReadOnly | IsCompany]
     serializer_class = JobTypeSerializer
 
     def get_queryset(self):
@@ -201,12 +442,14 @@ class JobTypeView(generics.RetrieveUpdateAPIView):
         """
         pk = self.kwargs.get("pk")
         try:
-            job = Job.objects.get(pk=pk)
-            if job.company != self.request.user and self.request.method != "GET":
-                raise PermissionDenied()
-            return job.job_types
+            job = Job.objects.only("id", "company_id").get(pk=pk)
         except Job.DoesNotExist:
             raise NotFound(detail="Job not found.", code=404)
+        # Writes are limited to companies (see permission_classes), so the
+        # owner can be checked on the foreign key without loading the company.
+        if self.request.method != "GET" and job.company_id != self.request.user.pk:
+            raise PermissionDenied()
+        return job.job_types
 
     def get(self, request, *args, **kwargs):
         """
@@ -233,20 +476,18 @@ class JobTypeView(generics.RetrieveUpdateAPIView):
         Raises:
             Response: If the request data is invalid.
         """
-        if not isinstance(self.request.user, Company):
-            return Response(status=status.HTTP_403_FORBIDDEN)
+        names = _get_names(request.data)
+        error_response = _invalid_names_response(names)
+        if error_response is not None:
+            return error_response
         queryset = self.get_queryset()
-        data = [{"name": name} for name in request.data.getlist("name")]
-        queryset.clear()
-        for job_type_data in data:
-            job_type, _ = JobType.objects.get_or_create(name=job_type_data["name"])
-            queryset.add(job_type)
+        queryset.set(_get_or_create_by_name(JobType, names))
         serializer = self.get_serializer(queryset.all(), many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 # Views for Talent endpoints
-class TalentList(generics.ListAPIView):
+class TalentList(CachedListMixin, generics.ListAPIView):
     """
     API endpoint for listing talent instances.
 
@@ -266,45 +507,39 @@ class TalentList(generics.ListAPIView):
 
     queryset = Talent.objects.all()
     serializer_class = TalentSerializer
-    pagination_class = DefaultPagination
+    pagination_class = TalentPagination
+    cache_namespace = "talents"
 
     def get_queryset(self):
         """
         Returns the queryset of Talent objects based on the provided query parameters.
 
-        The queryset is filtered by job types if 'skills' are provided in the query parameters.
-        It can also be sorted by average rating if 'sort_by' is provided in the query parameters.
+        The queryset is filtered by skills if 'skills' are provided in the query parameters.
+        Sorting by average rating ('sort_by') is done by TalentPagination.
 
         Returns:
             queryset (QuerySet): The filtered and sorted queryset of Talent objects.
         """
-        queryset = Talent.objects.all()
+        # The average rating is read by TalentPagination to build cursors
+        queryset = Talent.objects.only(
+            *_serialized_columns(TalentSerializer), "average_rating"
+        ).prefetch_related("skills")
 
-        # Filter by job types if provided in query parameters
+        # Filter by skills if provided in query parameters. Names are matched
+        # case-insensitively with a single IN lookup, and distinct() drops the
+        # duplicate rows produced by the many-to-many join.
         skills = self.request.query_params.getlist("skills")
         if skills:
-            query_condition = Q()
-            for skill in skills:
-                query_condition |= Q(skills__name__iexact=skill)
-            queryset = queryset.filter(query_condition)
-
-        # Sort by average rating if 'sort_by' is provided in query parameters
-        sort_by = self.request.query_params.get("sort_by")
-        if sort_by == "most_experienced":
-            # Use annotation to get the average rating and order by it
-            queryset = queryset.annotate(average_rating=Avg("review__rating")).order_by(
-                "-average_rating"
-            )
-        elif sort_by == "least_experienced":
-            # Use annotation to get the average rating and order by it
-            queryset = queryset.annotate(average_rating=Avg("review__rating")).order_by(
-                "average_rating"
+            queryset = (
+                queryset.alias(skill_name=Lower("skills__name"))
+                .filter(skill_name__in=[skill.lower() for skill in skills])
+                .distinct()
             )
 
         return queryset
 
 
-class TalentDetail(generics.RetrieveDestroyAPIView):
+class TalentDetail(AnonymousReadMixin, generics.RetrieveDestroyAPIView):
     """
     A view for retrieving, updating, and deleting individual talent instances.
 
@@ -313,22 +548,24 @@ class TalentDetail(generics.RetrieveDestroyAPIView):
         serializer_class (Serializer): The serializer class for Talent objects.
 
     Methods:
-        get_authenticators: Returns the authenticators based on the request method.
-        retrieve: Custom retrieve method to handle incrementing unique profile visits.
+        get: Counts the unique profile visit, then retrieves the talent.
+        retrieve: Retrieves the talent, answering conditional GETs.
     """
 
-    queryset = Talent.objects.all()
+    # Only load the serialized columns; the skills are fetched in one query.
+    queryset = Talent.objects.only(
+        *_serialized_columns(TalentSerializer)
+    ).prefetch_related("skills")
     serializer_class = TalentSerializer
     authentication_classes = [DiscordOrTwitterAuthentication]
+    permission_classes = [ReadOnly | IsTalent, IsSelfOrReadOnly]
 
-    def get_authenticators(self):
-        if self.request is None or self.request.method in permissions.SAFE_METHODS:
-            return []
-        return super().get_authenticators()
-
-    def retrieve(self, request, *args, **kwargs):
+    def get(self, request, *args, **kwargs):
         """
-        Retrieve a talent instance and increment unique profile visits.
+        Increment unique profile visits and retrieve the talent instance.
+
+        The visit is counted before the ETag is computed, so the ETag matches
+        the profile_visits rendered in the body.
 
         Args:
             request (HttpRequest): The HTTP request object.
@@ -338,105 +575,94 @@ class TalentDetail(generics.RetrieveDestroyAPIView):
         Returns:
             Response: The HTTP response object.
         """
-        instance = self.get_object()
         session_key = (
             request.session.session_key
             if hasattr(request.session, "session_key")
             else None
         )
         if session_key:
-            instance.increment_unique_visits(session_key)
+            try:
+                talent = Talent.objects.only("id", "profile_visits").get(
+                    pk=kwargs["pk"]
+                )
+            except Talent.DoesNotExist:
+                raise NotFound(detail="Talent not found.", code=404)
+            talent.increment_unique_visits(session_key)
+        return self.retrieve(request, *args, **kwargs)
+
+    # Profile visits are counted with an UPDATE that leaves updated_at untouched
+    @method_decorator(condition(etag_func=updated_at_etag(Talent, "profile_visits")))
+    def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
 
-    def destroy(self, request, *args, **kwargs):
-        if not isinstance(request.user, Talent):
-            return Response(status=status.HTTP_403_FORBIDDEN)
-        return super().destroy(request, *args, **kwargs)
-
 
-class UploadAvatar(generics.UpdateAPIView):
+class TalentSelfUpdateMixin:
     """
-    View to update the avatar of a talent.
+    Mixin for views that let a talent update one field of their own profile.
     """
 
-    authentication_classes = [DiscordOrTwitterAuthentication]
-    serializer_class = AvatarSerializer
+    permission_classes = [IsTalent]
 
     def get_object(self):
         """
         Get the talent object for the update operation.
-        """
-        user = self.request.user
 
-        if not isinstance(user, Talent):
-            self.permission_denied(self.request)
-
-        try:
-            talent = Talent.objects.get(pk=self.kwargs["pk"])
-        except Talent.DoesNotExist:
-            self.handle_not_found()
+        The requesting talent was already loaded by authentication, so it is
+        returned as is. The database is only queried to tell a missing talent
+        from someone else's profile.
 
-        if talent != user:
+        Raises:
+            NotFound: If the talent does not exist.
+            PermissionDenied: If the talent is not the requesting user.
+        """
+        user = self.request.user
+        if self.kwargs["pk"] != user.pk:
+            if not Talent.objects.filter(pk=self.kwargs["pk"]).exists():
+                raise NotFound(detail="Talent not found.", code=404)
             self.permission_denied(self.request)
-
-        return talent
-
-    def handle_not_found(self):
-        self.raise_exception(Response(status=status.HTTP_404_NOT_FOUND))
+        return user
 
     def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
         instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data)
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
-        return Response({"avatar": instance.avatar}, status=status.HTTP_200_OK)
+        return Response(self.get_response_data(instance, serializer))
 
     def perform_update(self, serializer):
-        serializer.save(instance=self.get_object())
-
-
-class Language(generics.UpdateAPIView):
-    """
-    View to update the language of a talent.
-    """
-
-    authentication_classes = [DiscordOrTwitterAuthentication]
-    serializer_class = LanguageSerializer
+        serializer.save()
 
-    def get_object(self):
+    def get_response_data(self, instance, serializer):
         """
-        Get the talent object for the update operation.
+        Return the body of the response to a successful update.
         """
-        user = self.request.user
+        return serializer.data
 
-        if not isinstance(user, Talent):
-            self.permission_denied(self.request)
 
-        try:
-            talent = Talent.objects.get(pk=self.kwargs["pk"])
-        except Talent.DoesNotExist:
-            self.handle_not_found()
+class UploadAvatar(TalentSelfUpdateMixin, generics.UpdateAPIView):
+    """
+    View to update the avatar of a talent.
+    """
 
-        if talent != user:
-            self.permission_denied(self.request)
+    authentication_classes = [DiscordOrTwitterAuthentication]
+    serializer_class = AvatarSerializer
 
-        return talent
+    def get_response_data(self, instance, serializer):
+        # The serializer holds the uploaded file; the talent holds its URL
+        return {"avatar": instance.avatar}
 
-    def handle_not_found(self):
-        self.raise_exception(Response(status=status.HTTP_404_NOT_FOUND))
 
-    def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-        return Response(serializer.data)
+class Language(TalentSelfUpdateMixin, generics.UpdateAPIView):
+    """
+    View to update the language of a talent.
+    """
 
-    def perform_update(self, serializer):
-        serializer.save()
+    authentication_classes = [DiscordOrTwitterAuthentication]
+    serializer_class = LanguageSerializer
 
 
-class Timezone(generics.UpdateAPIView):
+class Timezone(TalentSelfUpdateMixin, generics.UpdateAPIView):
     """
     View to update the timezone of a talent.
     """
@@ -444,40 +670,8 @@ class Timezone(generics.UpdateAPIView):
     authentication_classes = [DiscordOrTwitterAuthentication]
     serializer_class = TimeZoneSerializer
 
-    def get_object(self):
-        """
-        Get the talent object for the update operation.
-        """
-        user = self.request.user
-
-        if not isinstance(user, Talent):
-            self.permission_denied(self.request)
-
-        try:
-            talent = Talent.objects.get(pk=self.kwargs["pk"])
-        except Talent.DoesNotExist:
-            self.handle_not_found()
 
-        if talent != user:
-            self.permission_denied(self.request)
-
-        return talent
-
-    def handle_not_found(self):
-        self.raise_exception(Response(status=status.HTTP_404_NOT_FOUND))
-
-    def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-        return Response(serializer.data)
-
-    def perform_update(self, serializer):
-        serializer.save()
-
-
-class AboutMe(generics.UpdateAPIView):
+class AboutMe(TalentSelfUpdateMixin, generics.UpdateAPIView):
     """
     View to update the 'about me' information of a talent.
     """
@@ -485,40 +679,8 @@ class AboutMe(generics.UpdateAPIView):
     authentication_classes = [DiscordOrTwitterAuthentication]
     serializer_class = AboutMeSerializer
 
-    def get_object(self):
-        """
-        Get the talent object for the update operation.
-        """
-        user = self.request.user
-
-        if not isinstance(user, Talent):
-            self.permission_denied(self.request)
-
-        try:
-            talent = Talent.objects.get(pk=self.kwargs["pk"])
-        except Talent.DoesNotExist:
-            self.handle_not_found()
-
-        if talent != user:
-            self.permission_denied(self.request)
-
-        return talent
-
-    def handle_not_found(self):
-        self.raise_exception(Response(status=status.HTTP_404_NOT_FOUND))
-
-    def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-        return Response(serializer.data)
-
-    def perform_update(self, serializer):
-        serializer.save()
-
 
-class Summary(generics.UpdateAPIView):
+class Summary(TalentSelfUpdateMixin, generics.UpdateAPIView):
     """
     View to update the summary of a talent.
     """
@@ -526,40 +688,8 @@ class Summary(generics.UpdateAPIView):
     authentication_classes = [DiscordOrTwitterAuthentication]
     serializer_class = SummarySerializer
 
-    def get_object(self):
-        """
-        Get the talent object for the update operation.
-        """
-        user = self.request.user
-
-        if not isinstance(user, Talent):
-            self.permission_denied(self.request)
-
-        try:
-            talent = Talent.objects.get(pk=self.kwargs["pk"])
-        except Talent.DoesNotExist:
-            self.handle_not_found()
-
-        if talent != user:
-            self.permission_denied(self.request)
-
-        return talent
-
-    def handle_not_found(self):
-        self.raise_exception(Response(status=status.HTTP_404_NOT_FOUND))
-
-    def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-        return Response(serializer.data)
-
-    def perform_update(self, serializer):
-        serializer.save()
-
 
-class Username(generics.UpdateAPIView):
+class Username(TalentSelfUpdateMixin, generics.UpdateAPIView):
     """
     View to update the username of a talent.
     """
@@ -567,51 +697,15 @@ class Username(generics.UpdateAPIView):
     authentication_classes = [DiscordOrTwitterAuthentication]
     serializer_class = UsernameSerializer
 
-    def get_object(self):
-        """
-        Get the talent object for the update operation.
-        """
-        user = self.request.user
-
-        if not isinstance(user, Talent):
-            self.permission_denied(self.request)
 
-        try:
-            talent = Talent.objects.get(pk=self.kwargs["pk"])
-        except Talent.DoesNotExist:
-            self.handle_not_found()
-
-        if talent != user:
-            self.permission_denied(self.request)
-
-        return talent
-
-    def handle_not_found(self):
-        self.raise_exception(Response(status=status.HTTP_404_NOT_FOUND))
-
-    def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-        return Response(serializer.data)
-
-    def perform_update(self, serializer):
-        serializer.save()
-
-
-class SkillView(generics.RetrieveUpdateAPIView):
+class SkillView(AnonymousReadMixin, generics.RetrieveUpdateAPIView):
     """
     API view for retrieving and updating skills of a talent.
     """
 
     serializer_class = SkillSerializer
     authentication_classes = [DiscordOrTwitterAuthentication]
-
-    def get_authenticators(self):
-        if self.request is None or self.request.method in permissions.SAFE_METHODS:
-            return []
-        return super().get_authenticators()
+    permission_classes = [ReadOnly | IsTalent]
 
     def get_queryset(self):
         """
@@ -624,13 +718,17 @@ class SkillView(generics.RetrieveUpdateAPIView):
             NotFound: If the talent does not exist.
         """
         pk = self.kwargs.get("pk")
+        # Writes are limited to talents (see permission_classes), and the
+        # authenticated talent needs no second lookup to edit their own skills.
+        if self.request.method != "GET" and pk == self.request.user.pk:
+            return self.request.user.skills
         try:
-            talent = Talent.objects.get(pk=pk)
-            if talent != self.request.user and self.request.method != "GET":
-                raise PermissionDenied()
-            return talent.skills
+            talent = Talent.objects.only("id").get(pk=pk)
         except Talent.DoesNotExist:
             raise NotFound(detail="Talent not found.", code=404)
+        if self.request.method != "GET":
+            raise PermissionDenied()
+        return talent.skills
 
     def get(self, request, *args, **kwargs):
         """
@@ -653,25 +751,20 @@ class SkillView(generics.RetrieveUpdateAPIView):
         Raises:
             Response: If the request data is invalid or exceeds the maximum limit.
         """
-        if not isinstance(self.request.user, Talent):
-            return Response(status=status.HTTP_403_FORBIDDEN)
+        names = _get_names(request.data)
+        error_response = _invalid_names_response(names, max_names=5)
+        if error_response is not None:
+            return error_response
         queryset = self.get_queryset()
-        if len(request.data) > 5:
-            return Response(
-                {"detail": "You can only select a maximum of 5 skills."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        data = [{"name": name} for name in request.data.getlist("name")]
-        queryset.clear()
-        for skill_data in data:
-            skill, _ = Skill.objects.get_or_create(name=skill_data["name"])
-            queryset.add(skill)
+        queryset.set(_get_or_create_by_name(Skill, names))
         serializer = self.get_serializer(queryset.all(), many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 # Views for Experience endpoints
-class ExperienceList(generics.ListCreateAPIView):
+class ExperienceList(
+    AnonymousReadMixin, CachedListMixin, generics.ListCreateAPIView
+):
     """
     API endpoint for listing and creating experience instances.
     """
@@ -679,27 +772,22 @@ class ExperienceList(generics.ListCreateAPIView):
     queryset = Experience.objects.all()
     serializer_class = ExperienceSerializer
     authentication_classes = [DiscordOrTwitterAuthentication]
+    permission_classes = [ReadOnly | IsTalent]
+    cache_namespace = "experiences"
 
     def get_serializer_class(self):
         if self.request.method == "GET":
             return ExperienceOutputSerializer
         return ExperienceSerializer
 
-    def get_authenticators(self):
-        if self.request is None or self.request.method in permissions.SAFE_METHODS:
-            return []
-        return super().get_authenticators()
-
     def perform_create(self, serializer):
         """
         Set the owner of the experience to the user making the request.
         """
-        if not isinstance(self.request.user, Talent):
-            return Response(status=status.HTTP_403_FORBIDDEN)
         serializer.save(talent=self.request.user)
 
 
-class ExperienceDetail(generics.RetrieveUpdateDestroyAPIView):
+class ExperienceDetail(AnonymousReadMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API endpoint for retrieving, updating, and deleting individual experience instances.
     """
@@ -714,14 +802,11 @@ class ExperienceDetail(generics.RetrieveUpdateDestroyAPIView):
             return ExperienceOutputSerializer
         return ExperienceSerializer
 
-    def get_authenticators(self):
-        if self.request is None or self.request.method in permissions.SAFE_METHODS:
-            return []
-        return super().get_authenticators()
-
 
 # Views for Review endpoints
-class ReviewList(generics.ListCreateAPIView):
+class ReviewList(
+    AnonymousReadMixin, CachedListMixin, generics.ListCreateAPIView
+):
     """
     API view for listing and creating review instances.
 
@@ -735,35 +820,32 @@ class ReviewList(generics.ListCreateAPIView):
         perform_create: Performs the creation of a new review instance.
     """
 
-    queryset = Review.objects.all()
+    queryset = Review.objects.select_related("talent").only(
+        *_serialized_columns(ReviewSerializer), "talent", "talent__username"
+    )
     serializer_class = ReviewSerializer
     authentication_classes = [TokenAuthentication]
-
-    def get_authenticators(self):
-        if self.request is None or self.request.method in permissions.SAFE_METHODS:
-            return []
-        return super().get_authenticators()
+    permission_classes = [ReadOnly | IsCompany]
+    cache_namespace = "reviews"
 
     def perform_create(self, serializer):
         """
         Perform custom creation logic for the view.
 
         This method is called when a new object is being created.
-        It checks if the request user is an instance of the Company model.
-        If not, it returns a 403 Forbidden response.
-        Otherwise, it saves the serializer with the reviewer_organization set to the request user.
+        It saves the serializer with the reviewer_organization set to the
+        request user. Only companies get this far (see permission_classes).
 
         Args:
             serializer (Serializer): The serializer instance.
-
-        Returns:
-            Response: The HTTP response.
         """
-        if not isinstance(self.request.user, Company):
-            return Response(status=status.HTTP_403_FORBIDDEN)
         serializer.save(reviewer_organization=self.request.user)
 
 
+# The review renders its talent's username, which can change on its own
+@method_decorator(
+    condition(etag_func=updated_at_etag(Review, "talent__username")), name="get"
+)
 class ReviewDetail(generics.RetrieveAPIView):
     """
     Retrieve a single review instance.
@@ -777,7 +859,9 @@ class ReviewDetail(generics.RetrieveAPIView):
         authentication_classes (list): The list of authentication classes used for this view.
     """
 
-    queryset = Review.objects.all()
+    queryset = Review.objects.select_related("talent").only(
+        *_serialized_columns(ReviewSerializer), "talent", "talent__username"
+    )
     serializer_class = ReviewSerializer
     authentication_classes = []
 
@@ -787,6 +871,10 @@ def get_talent_average_rating(request, pk):
     """
     Get the average rating of a talent.
 
+    The rating is read from the denormalized Talent.average_rating column,
+    which api.signals keeps up to date. Talents without reviews keep 0.0 in
+    the column, for sorting, but have no average rating (null).
+
     Args:
         request (Request): The HTTP request object.
         pk (int): The primary key of the talent.
@@ -794,8 +882,13 @@ def get_talent_average_rating(request, pk):
     Returns:
         Response: The HTTP response object containing the average rating of the talent.
     """
-    try:
-        talent = Talent.objects.get(pk=pk)
-    except Talent.DoesNotExist:
+    data = (
+        Talent.objects.filter(pk=pk)
+        .annotate(has_reviews=Exists(Review.objects.filter(talent=OuterRef("pk"))))
+        .values("average_rating", "has_reviews")
+        .first()
+    )
+    if data is None:
         return Response(status=status.HTTP_404_NOT_FOUND)
-    return Response({"average_rating": talent.get_average_rating()})
+    average_rating = data["average_rating"] if data["has_reviews"] else None
+    return Response({"average_rating": average_rating})
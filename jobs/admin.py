@@ -7,8 +7,9 @@ from .models import Job
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
     list_display = ("job_title", "company_name", "location", "time_added")
+    # company_name reads the company of every row, so join it in the list query
+    list_select_related = ("company",)
 
+    @admin.display(ordering="company__name", description="Company Name")
     def company_name(self, obj):
         return obj.company.name
-
-    company_name.short_description = "Company Name"
@@ -1,4 +1,5 @@
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
 
 
 class CompanyManager(BaseUserManager):
@@ -39,3 +40,31 @@ class CompanyManager(BaseUserManager):
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
         return self.create_user(email, password, **extra_fields)
+
+
+class JobQuerySet(models.QuerySet):
+    """
+    A custom queryset for the Job model.
+    """
+
+    def with_types(self):
+        """
+        Prefetches the job types of the jobs in one query.
+
+        Only the id and name of the job types are loaded.
+
+        Returns:
+            QuerySet: The queryset with the job types prefetched.
+        """
+        job_type_model = self.model._meta.get_field("job_types").related_model
+        return self.prefetch_related(
+            models.Prefetch(
+                "job_types", queryset=job_type_model.objects.only("id", "name")
+            )
+        )
+
+
+class JobManager(models.Manager.from_queryset(JobQuerySet)):
+    """
+    A custom manager for the Job model.
+    """
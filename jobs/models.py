@@ -1,6 +1,7 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
-from .managers import CompanyManager
+from .managers import CompanyManager, JobManager
 
 
 class Company(AbstractBaseUser, PermissionsMixin):
@@ -63,6 +64,10 @@ class JobType(models.Model):
     ]
     name = models.CharField(max_length=200, choices=SKILL_CHOICES, unique=True)
 
+    class Meta:
+        # Job types are filtered by name case-insensitively
+        indexes = [models.Index(Lower("name"), name="jobtype_name_lower")]
+
     def __str__(self):
         return f"{self.name}"
 
@@ -80,6 +85,7 @@ class Job(models.Model):
         time_added (datetime): The date and time when the job was added.
         job_description (str): The description of the job.
         job_types (QuerySet): The types of the job.
+        updated_at (datetime): The date and time when the job was last updated.
     """
 
     job_logo = models.URLField(max_length=200)
@@ -90,6 +96,9 @@ class Job(models.Model):
     time_added = models.DateTimeField(auto_now=True, editable=False)
     job_description = models.TextField()
     job_types = models.ManyToManyField("JobType", related_name="job_types")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = JobManager()
 
     def __str__(self):
         return f"{self.company.name} - {self.job_title}"
@@ -1,3 +1,32 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Company, Job, JobType
+
+
+class JobManagerTests(TestCase):
+    def setUp(self):
+        company = Company.objects.create(
+            name="Company",
+            email="company@example.com",
+            logo="https://example.com/logo.png",
+        )
+        self.job = Job.objects.create(
+            job_logo="https://example.com/logo.png",
+            job_link="https://example.com/job",
+            company=company,
+            job_title="Moderator",
+            job_description="Description",
+        )
+        self.job.job_types.add(JobType.objects.create(name="Moderator"))
+
+    def test_company_is_not_joined_by_default(self):
+        self.assertEqual(Job.objects.all().query.select_related, False)
+        self.assertEqual(Job.objects.only("id").get().pk, self.job.pk)
+
+    def test_with_types_prefetches_job_types(self):
+        job = Job.objects.with_types().get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [job_type.name for job_type in job.job_types.all()], ["Moderator"]
+            )
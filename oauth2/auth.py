@@ -52,12 +52,12 @@ class TwitterAuthentication(BaseAuthentication):
         try:
             talent = Talent.objects.get(twitter_id=user.get("id"))
             talent.signed_in_with = "Twitter"
-            talent.save()
+            talent.save(update_fields=["signed_in_with"])
         except Talent.DoesNotExist:
             print("User not found... Creating new user")
             talent = Talent.objects.create_talent_twitter(user)
             talent.signed_in_with = "Twitter"
-            talent.save()
+            talent.save(update_fields=["signed_in_with"])
         except Exception as e:
             raise AuthenticationFailed(f"Error getting user: {e}")
         return talent
@@ -158,12 +158,12 @@ class DiscordAuthentication(BaseAuthentication):
         try:
             talent = Talent.objects.get(discord_id=user.get("id"))
             talent.signed_in_with = "Discord"
-            talent.save()
+            talent.save(update_fields=["signed_in_with"])
         except Talent.DoesNotExist:
             print("User not found... Creating new user")
             talent = Talent.objects.create_talent_discord(user)
             talent.signed_in_with = "Discord"
-            talent.save()
+            talent.save(update_fields=["signed_in_with"])
         except Exception as e:
             raise AuthenticationFailed(f"Error getting user: {e}")
         return talent
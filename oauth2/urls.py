@@ -9,7 +9,6 @@ from .views import (
     RefreshTwitterTokenView,
     RevokeTwitterTokenView,
 )
-from rest_framework.urlpatterns import format_suffix_patterns
 
 urlpatterns = [
     path(
@@ -31,5 +30,3 @@ urlpatterns = [
     path("twitter/refresh/", RefreshTwitterTokenView.as_view(), name="twitter-refresh"),
     path("twitter/revoke/", RevokeTwitterTokenView.as_view(), name="twitter-revoke"),
 ]
-
-urlpatterns = format_suffix_patterns(urlpatterns)
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, FloatField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from talents.models import Review, Talent
+
+
+class Command(BaseCommand):
+    """
+    Recompute the denormalized average rating of every talent.
+
+    Run it once after adding the Talent.average_rating column, or whenever
+    reviews were changed without going through the ORM signals (e.g. with
+    QuerySet.update() or raw SQL).
+    """
+
+    help = "Recompute Talent.average_rating from the talents' reviews."
+
+    def handle(self, *args, **options):
+        average_rating = (
+            Review.objects.filter(talent=OuterRef("pk"))
+            .values("talent")
+            .annotate(average_rating=Avg("rating"))
+            .values("average_rating")
+        )
+        updated = Talent.objects.update(
+            average_rating=Coalesce(
+                Subquery(average_rating, output_field=FloatField()), 0.0
+            )
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated the average rating of {updated} talents.")
+        )
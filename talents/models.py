@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from timezone_field import TimeZoneField
 from phonenumber_field.modelfields import PhoneNumberField
 from oauth2.managers import TalentOauth2Manager
@@ -33,6 +34,10 @@ class Talent(models.Model):
     about_me = models.TextField()
     summary = models.TextField()
     profile_visits = models.PositiveIntegerField(default=0, editable=False)
+    # Average of the review ratings, kept up to date by api.signals so that
+    # talents can be sorted by it without aggregating reviews per request.
+    # Talents without reviews have 0.0 here; the API reports null for them.
+    average_rating = models.FloatField(default=0.0, db_index=True, editable=False)
     email = models.EmailField(max_length=200, null=True, blank=True)
     discord_profile = models.CharField(max_length=200, null=True, blank=True)
     twitter_profile = models.CharField(max_length=200, null=True, blank=True)
@@ -41,28 +46,19 @@ class Talent(models.Model):
     last_login = models.DateTimeField(editable=False, null=True, blank=True)
     is_active = models.BooleanField(default=True)
     skills = models.ManyToManyField("Skill", blank=True)
-
-    def get_average_rating(self) -> float:
-        """
-        Calculates and returns the average rating for the talent.
-
-        Returns:
-            float: The average rating.
-        """
-        # Get all the reviews for this talent
-        reviews = Review.objects.filter(talent=self)
-
-        # Calculate the average rating
-        average_rating: float = reviews.aggregate(models.Avg("rating"))["rating__avg"]
-
-        return average_rating
+    updated_at = models.DateTimeField(auto_now=True)
 
     def increment_profile_visits(self):
         """
         Increments the profile visits count for the talent.
+
+        The count is incremented in the database with a single UPDATE, so
+        concurrent visits are not lost and the rest of the row is not written.
         """
+        Talent.objects.filter(pk=self.pk).update(
+            profile_visits=models.F("profile_visits") + 1
+        )
         self.profile_visits += 1
-        self.save()
 
     def increment_unique_visits(self, session_key):
         """
@@ -71,8 +67,8 @@ class Talent(models.Model):
         Args:
             session_key (str): The session key of the visitor.
         """
-        if not self.uniqueprofilevisit_set.filter(session_key=session_key).exists():
-            self.uniqueprofilevisit_set.create(session_key=session_key)
+        _, created = self.uniqueprofilevisit_set.get_or_create(session_key=session_key)
+        if created:
             self.increment_profile_visits()
 
     @property
@@ -119,6 +115,10 @@ class Skill(models.Model):
 
     name = models.CharField(max_length=200, choices=SKILL_CHOICES, unique=True)
 
+    class Meta:
+        # Skills are filtered by name case-insensitively
+        indexes = [models.Index(Lower("name"), name="skill_name_lower")]
+
     def __str__(self):
         return self.name
 
@@ -150,6 +150,7 @@ class Review(models.Model):
         reviewer_organization (Company): The organization of the reviewer.
         review (str, optional): The review text.
         rating (int): The rating given by the reviewer.
+        updated_at (datetime): The date and time when the review was last updated.
     """
 
     talent = models.ForeignKey(Talent, on_delete=models.CASCADE)
@@ -158,6 +159,13 @@ class Review(models.Model):
     reviewer_organization = models.OneToOneField(Company, on_delete=models.CASCADE)
     review = models.TextField(blank=True, null=True)
     rating = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Covers the average rating aggregate per talent
+        indexes = [
+            models.Index(fields=["talent", "rating"], name="review_talent_rating")
+        ]
 
     def __str__(self):
         return f"{self.reviewer_name} - {self.reviewer_organization}"
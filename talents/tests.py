@@ -1,3 +1,34 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from jobs.models import Company
+from .models import Review, Talent
+
+
+class BackfillAverageRatingTests(TestCase):
+    def test_backfills_average_rating(self):
+        reviewed = Talent.objects.create(avatar="https://example.com/a.png")
+        unreviewed = Talent.objects.create(avatar="https://example.com/b.png")
+        for rating in (3, 5):
+            company = Company.objects.create(
+                name="Company",
+                email=f"company{rating}@example.com",
+                logo="https://example.com/logo.png",
+            )
+            Review.objects.create(
+                talent=reviewed,
+                reviewer_name="Reviewer",
+                reviewer_organization=company,
+                rating=rating,
+            )
+        # Simulate a database written before the column was maintained
+        Talent.objects.update(average_rating=1.0)
+
+        call_command("backfill_average_rating", stdout=StringIO())
+
+        reviewed.refresh_from_db()
+        unreviewed.refresh_from_db()
+        self.assertEqual(reviewed.average_rating, 4.0)
+        self.assertEqual(unreviewed.average_rating, 0.0)